@@ -1,9 +1,12 @@
 """
 Developer Agent implementation that interfaces with LLM services and databases.
 """
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional
+import asyncio
 import logging
 
+import numpy as np
 from langchain.llms.base import BaseLLM
 
 from ..db.vector import VectorDBClient
@@ -11,6 +14,169 @@ from ..db.graph import GraphDBClient
 
 logger = logging.getLogger(__name__)
 
+class SemanticCache:
+    """
+    LRU cache of query responses keyed by query embedding.
+
+    Lookups compare the incoming embedding against all cached embeddings
+    with a single vectorized cosine-similarity scan; entries above the
+    similarity threshold are treated as hits, so paraphrased queries can
+    reuse an earlier response without touching the databases or the LLM.
+    """
+
+    def __init__(self, threshold: float = 0.95, max_size: int = 128):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a cache hit
+            max_size: Maximum number of cached entries (LRU eviction)
+        """
+        self.threshold = threshold
+        self.max_size = max_size
+        self._entries: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._next_key = 0
+        self._keys: List[int] = []
+        self._matrix: Optional[np.ndarray] = None
+        self._norms: Optional[np.ndarray] = None
+
+    def get(self, embedding: np.ndarray) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response for an embedding.
+
+        Args:
+            embedding: Query embedding vector
+
+        Returns:
+            Cached response dict if a sufficiently similar query was
+            cached, otherwise None
+        """
+        if not self._entries:
+            return None
+
+        q_norm = np.linalg.norm(embedding)
+        if q_norm == 0:
+            return None
+
+        similarities = (self._matrix @ embedding) / (self._norms * q_norm)
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.threshold:
+            return None
+
+        key = self._keys[best]
+        self._entries.move_to_end(key)
+        return self._entries[key]["response"]
+
+    def put(self, embedding: np.ndarray, response: Dict[str, Any]) -> None:
+        """
+        Cache a response under its query embedding.
+
+        Args:
+            embedding: Query embedding vector
+            response: Response dict to cache
+        """
+        embedding = np.asarray(embedding, dtype=np.float64)
+        self._entries[self._next_key] = {
+            "embedding": embedding,
+            "response": response,
+        }
+        self._next_key += 1
+
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        """Rebuild the stacked embedding matrix and norms after a change."""
+        self._keys = list(self._entries.keys())
+        embeddings = [entry["embedding"] for entry in self._entries.values()]
+        self._matrix = np.stack(embeddings)
+        self._norms = np.linalg.norm(self._matrix, axis=1)
+
+
+class _SearchBatcher:
+    """
+    Coalesces concurrent vector searches into batched requests.
+
+    Queries submitted within a short time window are collected and sent
+    to the vector database as a single batched search, then the results
+    are fanned back out to the individual awaiters. Under concurrent
+    load this replaces one round trip per query with one per batch.
+    """
+
+    def __init__(
+        self,
+        vector_db: VectorDBClient,
+        max_batch: int = 16,
+        window: float = 0.005
+    ):
+        """
+        Initialize the search batcher.
+
+        Args:
+            vector_db: Vector database client to issue batched searches on
+            max_batch: Maximum number of queries per batch
+            window: Time in seconds to wait for more queries to arrive
+        """
+        self.vector_db = vector_db
+        self.max_batch = max_batch
+        self.window = window
+        self._pending: List[tuple] = []
+        self._wakeup = asyncio.Event()
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, query: str, query_embedding=None) -> List[Dict[str, Any]]:
+        """
+        Submit a query for batched searching.
+
+        Args:
+            query: Query string to search for
+            query_embedding: Optional precomputed query embedding
+
+        Returns:
+            Search results for this query
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((query, query_embedding, future))
+        self._wakeup.set()
+
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+        return await future
+
+    async def _run(self) -> None:
+        """Background worker that drains pending queries in batches."""
+        while True:
+            await self._wakeup.wait()
+
+            # Leave a small window for more concurrent queries to arrive
+            if len(self._pending) < self.max_batch:
+                await asyncio.sleep(self.window)
+
+            batch, self._pending = self._pending[:self.max_batch], self._pending[self.max_batch:]
+            if not self._pending:
+                self._wakeup.clear()
+
+            if not batch:
+                continue
+
+            try:
+                results = await self.vector_db.search_batch(
+                    [query for query, _, _ in batch],
+                    query_embeddings=[embedding for _, embedding, _ in batch]
+                )
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for (_, _, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+
+
 class DeveloperAgent:
     """
     Developer Agent that interfaces with LLM services and databases to perform
@@ -37,7 +203,16 @@ class DeveloperAgent:
         self.vector_db = vector_db
         self.graph_db = graph_db
         self.config = config or {}
-        
+        self.cache = SemanticCache(
+            threshold=self.config.get("cache_similarity_threshold", 0.95),
+            max_size=self.config.get("cache_max_size", 128),
+        )
+        self._batcher = _SearchBatcher(
+            vector_db,
+            max_batch=self.config.get("search_max_batch", 16),
+            window=self.config.get("search_batch_window", 0.005),
+        )
+
         logger.info("Developer Agent initialized")
     
     async def process_query(self, query: str) -> Dict[str, Any]:
@@ -50,15 +225,43 @@ class DeveloperAgent:
         Returns:
             Response with relevant information
         """
-        # Search vector database for relevant code chunks
-        vector_results = await self.vector_db.search(query)
-        
-        # Query graph database for relationships
-        graph_results = await self.graph_db.query_relationships(query, vector_results)
-        
+        # Embed the query once; the embedding is reused for both the cache
+        # lookup and the vector search below
+        query_embedding = await self.vector_db.embed(query)
+
+        # Return a cached response for repeated or paraphrased queries,
+        # skipping the database and LLM calls entirely
+        cached_response = self.cache.get(query_embedding)
+        if cached_response is not None:
+            logger.debug(f"Semantic cache hit for query: {query}")
+            return cached_response
+
+        # Search vector database for relevant code chunks, coalescing
+        # concurrent queries into a single batched search
+        vector_task = asyncio.ensure_future(
+            self._batcher.submit(query, query_embedding=query_embedding)
+        )
+
+        # Query graph database for relationships. When the graph client
+        # can seed from the raw query alone, run that seed query
+        # concurrently with the vector search and refine it with the
+        # vector results afterwards, so the two round trips overlap
+        # instead of running back to back.
+        if hasattr(self.graph_db, "query_seed"):
+            seed_task = asyncio.ensure_future(self.graph_db.query_seed(query))
+            vector_results, graph_seed = await asyncio.gather(vector_task, seed_task)
+            graph_results = await self.graph_db.query_relationships(
+                query, vector_results, seed=graph_seed
+            )
+        else:
+            vector_results = await vector_task
+            graph_results = await self.graph_db.query_relationships(query, vector_results)
+
         # Generate response using LLM
         response = await self.generate_response(query, vector_results, graph_results)
-        
+
+        self.cache.put(query_embedding, response)
+
         return response
     
     async def generate_response(
@@ -108,22 +311,42 @@ class DeveloperAgent:
             Constructed prompt
         """
         # TODO: Implement prompt construction with proper context
-        prompt = f"Query: {query}\n\nContext:\n"
-        
+
+        # The large, stable sections (instructions and retrieved
+        # context) come first and the small variable query last, so
+        # server-side prefix KV caches can be reused across queries that
+        # retrieved overlapping context. Results are ordered by source
+        # so the same retrieval set always renders the same prefix.
+        parts = [
+            "You are a developer assistant. Answer the query at the end "
+            "using the code context and relationships below.\n"
+        ]
+
         # Add vector results
-        prompt += "\nCode Context:\n"
-        for i, result in enumerate(vector_results[:5]):  # Limit to top 5 results
-            prompt += f"{i+1}. {result.get('content', '')}\n"
-            prompt += f"   Source: {result.get('source', '')}\n\n"
-        
+        parts.append("\nCode Context:\n")
+        top_results = sorted(
+            vector_results[:5],  # Limit to top 5 results
+            key=lambda result: result.get("source") or ""
+        )
+        for i, result in enumerate(top_results):
+            parts.append(f"{i+1}. {result.get('content', '')}\n")
+            parts.append(f"   Source: {result.get('source', '')}\n\n")
+
         # Add graph results
-        prompt += "\nRelationships:\n"
-        for i, result in enumerate(graph_results[:5]):  # Limit to top 5 results
-            prompt += f"{i+1}. {result.get('relationship', '')}\n"
-            
-        prompt += "\nBased on the above context, please respond to the query."
-        
-        return prompt
+        parts.append("\nRelationships:\n")
+        top_graph = sorted(
+            graph_results[:5],  # Limit to top 5 results
+            key=lambda result: result.get("relationship") or ""
+        )
+        for i, result in enumerate(top_graph):
+            parts.append(f"{i+1}. {result.get('relationship', '')}\n")
+
+        parts.append(
+            "\nBased on the above context, please respond to the query."
+            f"\n\nQuery: {query}\n"
+        )
+
+        return "".join(parts)
     
     def _extract_sources(
         self, 
@@ -141,23 +364,28 @@ class DeveloperAgent:
             List of source information
         """
         sources = []
-        
+        seen = set()
+
         # Extract sources from vector results
         for result in vector_results:
-            if "source" in result and result["source"] not in [s.get("source") for s in sources]:
+            source = result.get("source")
+            if source is not None and source not in seen:
                 sources.append({
                     "type": "code",
-                    "source": result["source"],
+                    "source": source,
                     "relevance": result.get("score", 0)
                 })
-        
+                seen.add(source)
+
         # Extract sources from graph results
         for result in graph_results:
-            if "source" in result and result["source"] not in [s.get("source") for s in sources]:
+            source = result.get("source")
+            if source is not None and source not in seen:
                 sources.append({
                     "type": "relationship",
-                    "source": result["source"],
+                    "source": source,
                     "relevance": result.get("score", 0)
                 })
-        
+                seen.add(source)
+
         return sources
\ No newline at end of file
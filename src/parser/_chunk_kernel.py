@@ -0,0 +1,90 @@
+"""
+Optional Numba-accelerated kernel for computing chunk boundaries.
+
+The chunker's hot loop is a pure byte scan for newlines and blank-line
+transitions, which Numba compiles to native code. When Numba (or NumPy)
+is not installed, `chunk_spans` is None and the caller falls back to the
+pure-Python chunker.
+"""
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # pragma: no cover - optional acceleration
+    chunk_spans = None
+else:
+    @njit(cache=True)
+    def _chunk_offsets(buf, limit):
+        """
+        Scan a uint8 buffer for chunk boundaries.
+
+        Mirrors the blank-line / size-limit / end-of-content boundary
+        rules of the pure-Python chunker.
+
+        Args:
+            buf: File content as a uint8 array
+            limit: Chunk size limit in bytes
+
+        Returns:
+            (N, 4) int64 array of (start_byte, end_byte, start_line,
+            end_line) rows, one per chunk
+        """
+        n = buf.shape[0]
+
+        newlines = 0
+        for i in range(n):
+            if buf[i] == 10:
+                newlines += 1
+
+        out = np.empty((newlines + 1, 4), np.int64)
+        count = 0
+
+        chunk_start = 0
+        chunk_start_line = 0
+        line_no = 0
+        chunk_len = -1  # Length the lines would have when joined with \n
+        line_start = 0
+        blank = True
+
+        i = 0
+        while i <= n:
+            at_end = i == n
+            if at_end or buf[i] == 10:
+                chunk_len += (i - line_start) + 1
+
+                # End of chunk if empty line, last line, or size limit
+                if blank or at_end or chunk_len > limit:
+                    out[count, 0] = chunk_start
+                    out[count, 1] = i
+                    out[count, 2] = chunk_start_line
+                    out[count, 3] = line_no
+                    count += 1
+
+                    chunk_start = i + 1
+                    chunk_start_line = line_no + 1
+                    chunk_len = -1
+
+                line_no += 1
+                line_start = i + 1
+                blank = True
+            else:
+                b = buf[i]
+                if b != 32 and b != 9 and b != 11 and b != 12 and b != 13:
+                    blank = False
+            i += 1
+
+        return out[:count]
+
+    def chunk_spans(raw: bytes, limit: int):
+        """
+        Compute chunk spans for raw content bytes.
+
+        Args:
+            raw: File content bytes
+            limit: Chunk size limit in bytes
+
+        Returns:
+            (N, 4) int64 array of (start_byte, end_byte, start_line,
+            end_line) rows, one per chunk
+        """
+        buf = np.frombuffer(raw, dtype=np.uint8)
+        return _chunk_offsets(buf, limit)
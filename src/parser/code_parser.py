@@ -1,16 +1,651 @@
 """
 Code parser implementation for processing code repositories.
 """
+from dataclasses import dataclass
 from typing import Dict, List, Any, Optional
+import array
+import ast
+import asyncio
+import concurrent.futures
+import hashlib
+import mmap
 import os
 import logging
+import re
+import sys
 from pathlib import Path
 
 import libcst as cst
 from tree_sitter import Language, Parser
 
+from ._chunk_kernel import chunk_spans
+
 logger = logging.getLogger(__name__)
 
+try:
+    import aiofiles
+except ImportError:  # pragma: no cover - optional acceleration
+    aiofiles = None
+
+try:
+    import diskcache
+except ImportError:  # pragma: no cover - optional acceleration
+    diskcache = None
+
+try:
+    from tree_sitter_languages import get_parser as _load_ts_parser
+except ImportError:  # pragma: no cover - optional grammar bundle
+    _load_ts_parser = None
+
+# Per-process cache of loaded tree-sitter parsers, keyed by language;
+# None marks a language whose grammar failed to load
+_ts_parsers: Dict[str, Any] = {}
+
+# Bump to invalidate cached chunks when the chunking algorithm changes
+_CHUNK_CACHE_VERSION = 4
+
+# Bump to invalidate cached structure when its shape changes
+_STRUCTURE_CACHE_VERSION = 2
+
+# Open memory-mapped source files, keyed by path; see get_chunk_text
+_mmap_registry: Dict[str, mmap.mmap] = {}
+
+_parse_cache = None
+_parse_cache_dir = None
+
+# Matches one line including its newline; yields a zero-width match at
+# the end of the content
+_LINE_RE = re.compile(rb"[^\n]*\n?")
+
+# Language names are interned so the many dicts that store them share a
+# single string object per language
+SUPPORTED_LANGUAGES = {
+    ext: sys.intern(lang)
+    for ext, lang in {
+        ".py": "python",
+        ".js": "javascript",
+        ".ts": "typescript",
+        ".java": "java",
+        ".cpp": "cpp",
+        ".c": "c",
+        ".go": "go",
+        ".rb": "ruby",
+        ".rs": "rust",
+    }.items()
+}
+
+
+@dataclass(slots=True)
+class FuncInfo:
+    """Function or method record built during the structure pass."""
+    name: str
+    start_line: int
+    end_line: int
+    parameters: List[str]
+
+
+@dataclass(slots=True)
+class ClassInfo:
+    """Class record built during the structure pass."""
+    name: str
+    start_line: int
+    end_line: int
+    methods: List[FuncInfo]
+    bases: List[str]
+
+
+@dataclass(slots=True)
+class ImportInfo:
+    """Import record built during the structure pass."""
+    type: str
+    name: str
+    alias: Optional[str]
+    module: Optional[str] = None
+
+
+def _function_columns(functions: List[FuncInfo]) -> Dict[str, Any]:
+    """
+    Convert function records to parallel columns.
+
+    Structure is emitted in SoA form so graph ingestion can bind one
+    UNWIND/executemany batch per file instead of marshalling row by row.
+    Variable-length parameter lists are flattened with an offsets column:
+    function i's parameters are parameters_flat[offsets[i]:offsets[i+1]].
+
+    Args:
+        functions: Function records
+
+    Returns:
+        Dict of parallel columns
+    """
+    names: List[str] = []
+    start_lines = array.array("i")
+    end_lines = array.array("i")
+    parameters_flat: List[str] = []
+    parameters_offsets = array.array("i", [0])
+
+    for func in functions:
+        names.append(func.name)
+        start_lines.append(func.start_line)
+        end_lines.append(func.end_line)
+        parameters_flat.extend(func.parameters)
+        parameters_offsets.append(len(parameters_flat))
+
+    return {
+        "names": names,
+        "start_lines": start_lines,
+        "end_lines": end_lines,
+        "parameters_flat": parameters_flat,
+        "parameters_offsets": parameters_offsets,
+    }
+
+
+def _class_columns(classes: List[ClassInfo]) -> Dict[str, Any]:
+    """
+    Convert class records to parallel columns.
+
+    Methods across all classes are flattened into one set of function
+    columns with a class_index column mapping each method back to its
+    class row; bases use the same flat-plus-offsets layout as
+    parameters.
+
+    Args:
+        classes: Class records
+
+    Returns:
+        Dict of parallel columns
+    """
+    names: List[str] = []
+    start_lines = array.array("i")
+    end_lines = array.array("i")
+    bases_flat: List[str] = []
+    bases_offsets = array.array("i", [0])
+    methods: List[FuncInfo] = []
+    method_class_index = array.array("i")
+
+    for index, cls in enumerate(classes):
+        names.append(cls.name)
+        start_lines.append(cls.start_line)
+        end_lines.append(cls.end_line)
+        bases_flat.extend(cls.bases)
+        bases_offsets.append(len(bases_flat))
+
+        for method in cls.methods:
+            methods.append(method)
+            method_class_index.append(index)
+
+    columns = {
+        "names": names,
+        "start_lines": start_lines,
+        "end_lines": end_lines,
+        "bases_flat": bases_flat,
+        "bases_offsets": bases_offsets,
+        "methods": _function_columns(methods),
+    }
+    columns["methods"]["class_index"] = method_class_index
+    return columns
+
+
+def _import_columns(imports: List[ImportInfo]) -> Dict[str, Any]:
+    """
+    Convert import records to parallel columns.
+
+    Args:
+        imports: Import records
+
+    Returns:
+        Dict of parallel columns; modules holds None for plain imports
+    """
+    return {
+        "types": [imp.type for imp in imports],
+        "modules": [imp.module for imp in imports],
+        "names": [imp.name for imp in imports],
+        "aliases": [imp.alias for imp in imports],
+    }
+
+
+async def _read_file_async(path: str) -> bytes:
+    """
+    Read a file without blocking the event loop.
+
+    Uses aiofiles when available so many small reads can be in flight
+    at once; otherwise falls back to a thread-offloaded blocking read.
+    Content stays as bytes all the way through the parse pipeline;
+    chunk text is decoded on demand by get_chunk_text.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Raw file content
+    """
+    if aiofiles is not None:
+        async with aiofiles.open(path, "rb") as f:
+            return await f.read()
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _read_file_sync, path)
+
+
+def _read_file_sync(path: str) -> bytes:
+    """Blocking file read used as the aiofiles fallback."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _iter_files(dir_path: str):
+    """
+    Yield (name, path) pairs for all files under a directory.
+
+    A manual DFS over os.scandir that keeps plain string paths, avoiding
+    the per-entry allocations of os.walk plus Path construction in the
+    hot loop. Symlinked directories are not followed.
+
+    Args:
+        dir_path: Directory to walk
+
+    Yields:
+        (file name, full path) tuples
+    """
+    try:
+        entries = os.scandir(dir_path)
+    except OSError as e:
+        logger.error(f"Error scanning directory {dir_path}: {e}")
+        return
+
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_files(entry.path)
+            elif entry.is_file():
+                yield entry.name, entry.path
+
+
+def _get_parse_cache(cache_dir: Optional[str]):
+    """
+    Get the process-wide parse cache.
+
+    Backed by diskcache when available (shared across runs and worker
+    processes); otherwise an in-process dict.
+
+    Args:
+        cache_dir: Directory for the on-disk cache
+
+    Returns:
+        Cache object with dict-style get/set
+    """
+    global _parse_cache, _parse_cache_dir
+
+    if _parse_cache is None or _parse_cache_dir != cache_dir:
+        if diskcache is not None and cache_dir:
+            _parse_cache = diskcache.Cache(cache_dir)
+        else:
+            _parse_cache = {}
+        _parse_cache_dir = cache_dir
+
+    return _parse_cache
+
+
+def _warm_worker() -> None:
+    """
+    Initializer for pool worker processes.
+
+    Loads tree-sitter grammars and triggers the Numba kernel compile up
+    front, so the first real parse task in each worker does not pay the
+    cold-start cost.
+    """
+    if _load_ts_parser is not None:
+        for language in set(SUPPORTED_LANGUAGES.values()):
+            if language != "python":
+                _get_ts_parser(language)
+
+    if chunk_spans is not None:
+        chunk_spans(b"x\n", 1000)
+
+
+def _parse_file_worker(
+    path: str,
+    content: bytes,
+    cache_dir: Optional[str] = None,
+    use_libcst: bool = False
+) -> Dict[str, Any]:
+    """
+    Parse a single file's content. Runs inside a pool worker process.
+
+    Args:
+        path: Path to the file
+        content: Raw file content
+        cache_dir: Directory for the on-disk parse cache
+        use_libcst: Parse Python with libcst instead of ast
+
+    Returns:
+        Parsed file data
+    """
+    ext = os.path.splitext(path)[1].lower()
+    language = SUPPORTED_LANGUAGES.get(ext)
+
+    if not language:
+        raise ValueError(f"Unsupported file type: {ext}")
+
+    if language == "python":
+        return _parse_python_source(path, content, cache_dir, use_libcst)
+    return _parse_generic_source(path, content, language)
+
+
+def _parse_python_source(
+    path: str,
+    content: bytes,
+    cache_dir: Optional[str] = None,
+    use_libcst: bool = False
+) -> Dict[str, Any]:
+    """
+    Parse Python source and extract its structure.
+
+    Uses the C-implemented stdlib ast parser by default; libcst only
+    when use_libcst is set, for callers that need concrete syntax. The
+    extracted fields are the same either way.
+
+    Structure and chunks are memoized by content digest, so unchanged
+    files skip the full parse and traversal on reparses. They are cached
+    under separate keys so a chunking algorithm change only invalidates
+    chunks.
+
+    Args:
+        path: Path to the file
+        content: Raw file content
+        cache_dir: Directory for the on-disk parse cache
+        use_libcst: Parse with libcst instead of ast
+
+    Returns:
+        Parsed Python file data
+    """
+    cache = _get_parse_cache(cache_dir)
+    digest = hashlib.blake2b(content).hexdigest()
+    path = sys.intern(path)
+
+    # Chunks are cached without their source (the cache is keyed by
+    # content, which can appear at several paths); it is filled in here
+    chunks = cache.get(f"chunks:{_CHUNK_CACHE_VERSION}:{digest}")
+    if chunks is None:
+        chunks = _chunk_content(content, "python")
+        cache[f"chunks:{_CHUNK_CACHE_VERSION}:{digest}"] = chunks
+    chunks = [dict(chunk, source=path) for chunk in chunks]
+
+    structure_key = (
+        f"structure:{_STRUCTURE_CACHE_VERSION}:"
+        f"{'cst' if use_libcst else 'ast'}:{digest}"
+    )
+    structure = cache.get(structure_key)
+    if structure is None:
+        try:
+            if use_libcst:
+                module = cst.parse_module(content)
+
+                # Extract classes and functions
+                visitor = LibcstStructureVisitor()
+                module.visit(visitor)
+            else:
+                tree = ast.parse(content)
+
+                # Extract classes and functions
+                visitor = PythonStructureVisitor()
+                visitor.visit(tree)
+
+            # Records are converted to columns only at this serialization
+            # boundary; inside the visitors they stay slotted dataclasses
+            structure = {
+                "classes": _class_columns(visitor.classes),
+                "functions": _function_columns(visitor.functions),
+                "imports": _import_columns(visitor.imports),
+            }
+            cache[structure_key] = structure
+        except Exception as e:
+            logger.error(f"Error parsing Python file {path}: {e}")
+            return {
+                "path": path,
+                "language": "python",
+                "error": str(e),
+                "chunks": chunks
+            }
+
+    return {
+        "path": path,
+        "language": "python",
+        **structure,
+        "chunks": chunks
+    }
+
+
+def _get_ts_parser(language: str):
+    """
+    Get a tree-sitter parser for a language, loading and caching it per
+    process. Returns None when the grammar bundle is not installed or
+    the language has no grammar.
+
+    Args:
+        language: Programming language
+
+    Returns:
+        tree_sitter.Parser or None
+    """
+    if _load_ts_parser is None:
+        return None
+
+    if language not in _ts_parsers:
+        try:
+            _ts_parsers[language] = _load_ts_parser(language)
+        except Exception as e:
+            logger.warning(f"No tree-sitter grammar for {language}: {e}")
+            _ts_parsers[language] = None
+
+    return _ts_parsers[language]
+
+
+def _extract_ts_structure(root, raw: bytes) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Extract classes and functions from a tree-sitter parse tree.
+
+    Walks named definition/declaration nodes generically, so one pass
+    works across grammars; functions found inside a class node are
+    recorded as its methods, mirroring the Python visitors.
+
+    Args:
+        root: Root node of the parse tree
+        raw: Source bytes the tree was parsed from
+
+    Returns:
+        Dict with classes and functions lists
+    """
+    classes: List[Dict[str, Any]] = []
+    functions: List[Dict[str, Any]] = []
+
+    def visit(node, current_class):
+        node_type = node.type
+        if node_type.endswith(("_definition", "_declaration", "_item")):
+            name_node = node.child_by_field_name("name")
+            if name_node is not None:
+                info = {
+                    "name": raw[name_node.start_byte:name_node.end_byte].decode("utf-8"),
+                    "start_line": node.start_point[0] + 1,
+                    "end_line": node.end_point[0] + 1,
+                }
+
+                if "class" in node_type or "struct" in node_type:
+                    info["methods"] = []
+                    classes.append(info)
+                    for child in node.named_children:
+                        visit(child, info)
+                    return
+                if "function" in node_type or "method" in node_type:
+                    if current_class is not None:
+                        current_class["methods"].append(info)
+                    else:
+                        functions.append(info)
+
+        for child in node.named_children:
+            visit(child, current_class)
+
+    visit(root, None)
+    return {"classes": classes, "functions": functions}
+
+
+def _parse_generic_source(path: str, content: bytes, language: str) -> Dict[str, Any]:
+    """
+    Parse source in a non-Python language using tree-sitter.
+
+    Args:
+        path: Path to the file
+        content: Raw file content
+        language: Programming language
+
+    Returns:
+        Parsed file data
+    """
+    path = sys.intern(path)
+    result = {
+        "path": path,
+        "language": language,
+        "chunks": _chunk_content(content, language, source=path)
+    }
+
+    parser = _get_ts_parser(language)
+    if parser is not None:
+        try:
+            tree = parser.parse(content)
+            result.update(_extract_ts_structure(tree.root_node, content))
+        except Exception as e:
+            logger.error(f"Error parsing {language} file {path}: {e}")
+            result["error"] = str(e)
+
+    return result
+
+
+def _chunk_content(
+    content: bytes,
+    language: str,
+    source: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Split file content into semantic chunks.
+
+    Operates on raw bytes, so offsets are byte offsets into the source
+    file and the size limit is measured in bytes; nothing is decoded
+    here.
+
+    Args:
+        content: Raw file content
+        language: Programming language
+        source: Source path to record on each chunk
+
+    Returns:
+        List of content chunks
+    """
+    # One interned language object is shared by every chunk dict instead
+    # of one string per chunk
+    language = sys.intern(language)
+    # Simple chunking by splitting on empty lines. A single regex scan
+    # over the content with running offsets replaces the per-line list
+    # building and repeated joins of the naive version.
+    # TODO: Implement more sophisticated chunking based on language semantics
+
+    # Compiled byte-scan kernel when Numba is available
+    if chunk_spans is not None:
+        return [
+            {
+                "offset": int(start),
+                "length": int(stop - start),
+                "start_line": int(start_line),
+                "end_line": int(end_line),
+                "language": language,
+                "source": source
+            }
+            for start, stop, start_line, end_line in chunk_spans(content, 1000)
+        ]
+
+    chunks = []
+    end = len(content)
+
+    chunk_start_offset = 0
+    chunk_start_line = 0
+    line_no = 0
+    chunk_len = -1  # Length the lines would have when joined with "\n"
+
+    for match in _LINE_RE.finditer(content):
+        start, stop = match.span()
+
+        # The scanner yields a trailing zero-width match; it only
+        # represents a real (empty) last line if the content ends in a
+        # newline or is itself empty
+        if start == end and content and not content.endswith(b"\n"):
+            break
+
+        has_newline = stop > start and content[stop - 1] == 0x0A
+        line_stop = stop - 1 if has_newline else stop
+        chunk_len += (line_stop - start) + 1
+        is_last = start == end or (stop == end and not has_newline)
+
+        # End of chunk if empty line or chunk size limit reached
+        if (not content[start:line_stop].strip() or is_last or
+            chunk_len > 1000):  # Chunk size limit
+
+            chunks.append({
+                "offset": chunk_start_offset,
+                "length": line_stop - chunk_start_offset,
+                "start_line": chunk_start_line,
+                "end_line": line_no,
+                "language": language,
+                "source": source
+            })
+
+            chunk_start_offset = stop
+            chunk_start_line = line_no + 1
+            chunk_len = -1
+
+        line_no += 1
+        if is_last:
+            break
+
+    return chunks
+
+
+def get_chunk_text(chunk: Dict[str, Any]) -> str:
+    """
+    Lazily load a chunk's text from its source file.
+
+    The source file is memory-mapped on first use and kept in a
+    process-wide registry, so chunk text is decoded on demand instead of
+    being duplicated in every chunk dict.
+
+    Args:
+        chunk: Chunk dict with offset, length, and source
+
+    Returns:
+        Decoded chunk text
+    """
+    source = chunk["source"]
+    mm = _mmap_registry.get(source)
+
+    if mm is None:
+        fd = os.open(source, os.O_RDONLY)
+        try:
+            if os.fstat(fd).st_size == 0:
+                return ""
+            mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+        _mmap_registry[source] = mm
+
+    offset = chunk["offset"]
+    return mm[offset:offset + chunk["length"]].decode("utf-8")
+
+
+def clear_chunk_registry() -> None:
+    """Close all memory-mapped source files held for chunk loading."""
+    for mm in _mmap_registry.values():
+        mm.close()
+    _mmap_registry.clear()
+
+
 class CodeParser:
     """
     Parser for code repositories that extracts structure and relationships
@@ -25,205 +660,253 @@ class CodeParser:
             config: Optional configuration parameters
         """
         self.config = config or {}
-        self.supported_languages = {
-            ".py": "python",
-            ".js": "javascript",
-            ".ts": "typescript",
-            ".java": "java",
-            ".cpp": "cpp",
-            ".c": "c",
-            ".go": "go",
-            ".rb": "ruby",
-            ".rs": "rust",
-        }
-        
+        self.supported_languages = SUPPORTED_LANGUAGES
+        self._supported_exts = frozenset(SUPPORTED_LANGUAGES)
+
+        # Parsing is CPU-bound and GIL-bound, so files are dispatched to
+        # a process pool to parse in parallel across cores. The pool
+        # lives for the parser's lifetime and each worker warms its
+        # parsers once at startup instead of on its first task.
+        self._pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.config.get("parse_workers", os.cpu_count()),
+            initializer=_warm_worker
+        )
+
+        # Parsed structure and chunks are memoized by content digest so
+        # unchanged files are not re-parsed across runs
+        self._parse_cache_dir = self.config.get("parse_cache_dir", ".fluxio_parse_cache")
+
         # Initialize parsers
         self._init_parsers()
-        
+
         logger.info("Code Parser initialized")
     
     def _init_parsers(self):
         """Initialize language-specific parsers."""
-        # TODO: Initialize tree-sitter parsers for each supported language
-        self.parsers = {}
-        
-        # For Python, we'll use libcst for more detailed parsing
-        self.python_parser = cst.parse_module
+        # tree-sitter parsers are loaded lazily per language (and per
+        # worker process); this just exposes the loader for callers that
+        # want a parser directly
+        self.parsers = {
+            language: _get_ts_parser(language)
+            for language in set(SUPPORTED_LANGUAGES.values())
+            if _load_ts_parser is not None and language != "python"
+        }
+
+        # Structure extraction only needs names, line ranges, and
+        # parameters, which the stdlib ast module provides at a fraction
+        # of libcst's cost; libcst stays available for callers that need
+        # concrete syntax
+        self._use_libcst = self.config.get("use_libcst", False)
+        self.python_parser = cst.parse_module if self._use_libcst else ast.parse
     
     async def parse_repository(self, repo_path: str) -> Dict[str, Any]:
         """
         Parse a code repository and extract structure and content.
-        
+
         Args:
             repo_path: Path to the code repository
-            
+
         Returns:
             Parsed repository data
         """
-        repo_path = Path(repo_path)
-        if not repo_path.exists():
-            raise ValueError(f"Repository path does not exist: {repo_path}")
-        
-        logger.info(f"Parsing repository: {repo_path}")
-        
-        parsed_files = []
-        for root, _, files in os.walk(repo_path):
-            for file in files:
-                file_path = Path(root) / file
-                ext = file_path.suffix.lower()
-                
-                if ext in self.supported_languages:
-                    try:
-                        parsed_file = await self.parse_file(file_path)
-                        parsed_files.append(parsed_file)
-                    except Exception as e:
-                        logger.error(f"Error parsing file {file_path}: {e}")
-        
+        repo_path = os.fspath(repo_path)
         return {
-            "repository": str(repo_path),
-            "files": parsed_files
+            "repository": repo_path,
+            "files": [parsed async for parsed in self.iter_parsed_files(repo_path)]
         }
-    
-    async def parse_file(self, file_path: Path) -> Dict[str, Any]:
-        """
-        Parse a single file and extract its structure and content.
-        
-        Args:
-            file_path: Path to the file
-            
-        Returns:
-            Parsed file data
-        """
-        ext = file_path.suffix.lower()
-        language = self.supported_languages.get(ext)
-        
-        if not language:
-            raise ValueError(f"Unsupported file type: {ext}")
-        
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        
-        if language == "python":
-            return await self._parse_python_file(file_path, content)
-        else:
-            return await self._parse_generic_file(file_path, content, language)
-    
-    async def _parse_python_file(self, file_path: Path, content: str) -> Dict[str, Any]:
+
+    async def iter_parsed_files(self, repo_path: str):
         """
-        Parse a Python file using libcst.
-        
+        Parse a code repository, yielding each parsed file as soon as it
+        completes.
+
+        Lets downstream embedding and indexing start on the first parsed
+        file instead of waiting for the whole repository, and avoids
+        holding every parsed file in memory at once. Files are yielded
+        in completion order, not walk order.
+
         Args:
-            file_path: Path to the file
-            content: File content
-            
-        Returns:
-            Parsed Python file data
+            repo_path: Path to the code repository
+
+        Yields:
+            Parsed file data dicts
         """
-        try:
-            module = self.python_parser(content)
-            
-            # Extract classes and functions
-            visitor = PythonStructureVisitor()
-            module.visit(visitor)
-            
-            return {
-                "path": str(file_path),
-                "language": "python",
-                "classes": visitor.classes,
-                "functions": visitor.functions,
-                "imports": visitor.imports,
-                "content": content,
-                "chunks": self._chunk_content(content, "python")
-            }
-        except Exception as e:
-            logger.error(f"Error parsing Python file {file_path}: {e}")
-            return {
-                "path": str(file_path),
-                "language": "python",
-                "error": str(e),
-                "content": content,
-                "chunks": self._chunk_content(content, "python")
-            }
+        repo_path = os.fspath(repo_path)
+        if not os.path.exists(repo_path):
+            raise ValueError(f"Repository path does not exist: {repo_path}")
+
+        logger.info(f"Parsing repository: {repo_path}")
+
+        # Filter on the extension alone before doing any further work
+        # per entry; most files in a real repo are skipped here
+        supported_exts = self._supported_exts
+        paths = []
+        for name, path in _iter_files(repo_path):
+            dot = name.rfind(".")
+            if dot <= 0:
+                continue
+
+            if name[dot:].lower() in supported_exts:
+                paths.append(path)
+
+        # Dispatch all reads at once so they overlap, then fan the
+        # parsing out across the worker processes
+        contents = await asyncio.gather(
+            *[_read_file_async(path) for path in paths], return_exceptions=True
+        )
+
+        loop = asyncio.get_running_loop()
+        tasks = {}
+        for path, content in zip(paths, contents):
+            if isinstance(content, Exception):
+                logger.error(f"Error reading file {path}: {content}")
+            else:
+                task = loop.run_in_executor(
+                    self._pool, _parse_file_worker, path, content,
+                    self._parse_cache_dir, self._use_libcst
+                )
+                tasks[task] = path
+
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                try:
+                    yield task.result()
+                except Exception as e:
+                    logger.error(f"Error parsing file {tasks[task]}: {e}")
     
-    async def _parse_generic_file(self, file_path: Path, content: str, language: str) -> Dict[str, Any]:
+    async def parse_file(self, file_path: Path) -> Dict[str, Any]:
         """
-        Parse a file using tree-sitter.
+        Parse a single file and extract its structure and content.
         
         Args:
             file_path: Path to the file
-            content: File content
-            language: Programming language
             
         Returns:
             Parsed file data
         """
-        # TODO: Implement tree-sitter parsing for other languages
-        return {
-            "path": str(file_path),
-            "language": language,
-            "content": content,
-            "chunks": self._chunk_content(content, language)
-        }
-    
-    def _chunk_content(self, content: str, language: str) -> List[Dict[str, Any]]:
-        """
-        Split file content into semantic chunks.
-        
-        Args:
-            content: File content
-            language: Programming language
-            
-        Returns:
-            List of content chunks
-        """
-        # Simple chunking by splitting on empty lines
-        # TODO: Implement more sophisticated chunking based on language semantics
-        chunks = []
-        lines = content.split("\n")
-        
-        current_chunk = []
-        current_chunk_start = 0
-        
-        for i, line in enumerate(lines):
-            current_chunk.append(line)
-            
-            # End of chunk if empty line or chunk size limit reached
-            if (not line.strip() or i == len(lines) - 1 or 
-                len("\n".join(current_chunk)) > 1000):  # Chunk size limit
-                
-                if current_chunk:
-                    chunk_content = "\n".join(current_chunk)
-                    chunks.append({
-                        "content": chunk_content,
-                        "start_line": current_chunk_start,
-                        "end_line": i,
-                        "language": language
-                    })
-                
-                current_chunk = []
-                current_chunk_start = i + 1
-        
-        return chunks
+        path = str(file_path)
+        content = await _read_file_async(path)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._pool, _parse_file_worker, path, content,
+            self._parse_cache_dir, self._use_libcst
+        )
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        self._pool.shutdown(wait=True)
+
+    async def __aenter__(self) -> "CodeParser":
+        return self
 
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
 
-class PythonStructureVisitor(cst.CSTVisitor):
+
+class PythonStructureVisitor(ast.NodeVisitor):
     """Visitor to extract structure from Python code."""
-    
+
     def __init__(self):
         super().__init__()
         self.classes = []
         self.functions = []
         self.imports = []
         self.current_class = None
-    
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        class_info = ClassInfo(
+            name=node.name,
+            start_line=node.lineno,
+            end_line=node.end_lineno or node.lineno,
+            methods=[],
+            bases=[base.id for base in node.bases if isinstance(base, ast.Name)]
+        )
+
+        # Store previous class context
+        prev_class = self.current_class
+        self.current_class = class_info
+        self.classes.append(class_info)
+
+        # Visit class body
+        self.generic_visit(node)
+
+        # Restore previous class context
+        self.current_class = prev_class
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self._visit_function(node)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        self._visit_function(node)
+
+    def _visit_function(self, node) -> None:
+        function_info = FuncInfo(
+            name=node.name,
+            start_line=node.lineno,
+            end_line=node.end_lineno or node.lineno,
+            parameters=[arg.arg for arg in node.args.args]
+        )
+
+        if self.current_class:
+            self.current_class.methods.append(function_info)
+        else:
+            self.functions.append(function_info)
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for name in node.names:
+            self.imports.append(ImportInfo(
+                type="import",
+                name=name.name,
+                alias=name.asname
+            ))
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        for name in node.names:
+            self.imports.append(ImportInfo(
+                type="import_from",
+                name=name.name,
+                alias=name.asname,
+                module=node.module or ""
+            ))
+
+
+class LibcstStructureVisitor(cst.CSTVisitor):
+    """
+    Visitor to extract structure from Python code via libcst.
+
+    Only used when callers opt into concrete-syntax parsing with the
+    use_libcst config flag; the default structure pass uses the much
+    faster C-implemented ast module.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.classes = []
+        self.functions = []
+        self.imports = []
+        self.current_class = None
+
     def visit_ClassDef(self, node: cst.ClassDef) -> None:
-        class_info = {
-            "name": node.name.value,
-            "start_line": node.start_pos[0] if node.start_pos else 0,
-            "end_line": node.end_pos[0] if node.end_pos else 0,
-            "methods": [],
-            "bases": [base.value.value for base in node.bases if hasattr(base.value, "value")]
-        }
+        # getattr with a default avoids hasattr's internal
+        # try/except on every base
+        bases = [
+            base_name for base_name in (
+                getattr(base.value, "value", None) for base in node.bases
+            )
+            if base_name is not None
+        ]
+
+        class_info = ClassInfo(
+            name=node.name.value,
+            start_line=node.start_pos[0] if node.start_pos else 0,
+            end_line=node.end_pos[0] if node.end_pos else 0,
+            methods=[],
+            bases=bases
+        )
         
         # Store previous class context
         prev_class = self.current_class
@@ -239,33 +922,40 @@ class PythonStructureVisitor(cst.CSTVisitor):
         self.current_class = prev_class
     
     def visit_FunctionDef(self, node: cst.FunctionDef) -> None:
-        function_info = {
-            "name": node.name.value,
-            "start_line": node.start_pos[0] if node.start_pos else 0,
-            "end_line": node.end_pos[0] if node.end_pos else 0,
-            "parameters": [param.name.value for param in node.params.params 
-                          if hasattr(param, "name") and hasattr(param.name, "value")]
-        }
-        
+        parameters = [
+            param_name for param_name in (
+                getattr(getattr(param, "name", None), "value", None)
+                for param in node.params.params
+            )
+            if param_name is not None
+        ]
+
+        function_info = FuncInfo(
+            name=node.name.value,
+            start_line=node.start_pos[0] if node.start_pos else 0,
+            end_line=node.end_pos[0] if node.end_pos else 0,
+            parameters=parameters
+        )
+
         if self.current_class:
-            self.current_class["methods"].append(function_info)
+            self.current_class.methods.append(function_info)
         else:
             self.functions.append(function_info)
-    
+
     def visit_Import(self, node: cst.Import) -> None:
         for name in node.names:
-            self.imports.append({
-                "type": "import",
-                "name": name.name.value,
-                "alias": name.asname.name.value if name.asname else None
-            })
-    
+            self.imports.append(ImportInfo(
+                type="import",
+                name=name.name.value,
+                alias=name.asname.name.value if name.asname else None
+            ))
+
     def visit_ImportFrom(self, node: cst.ImportFrom) -> None:
         module = ".".join([n.value for n in node.module]) if node.module else ""
         for name in node.names:
-            self.imports.append({
-                "type": "import_from",
-                "module": module,
-                "name": name.name.value,
-                "alias": name.asname.name.value if name.asname else None
-            })
\ No newline at end of file
+            self.imports.append(ImportInfo(
+                type="import_from",
+                name=name.name.value,
+                alias=name.asname.name.value if name.asname else None,
+                module=module
+            ))
\ No newline at end of file